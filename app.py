@@ -1,38 +1,498 @@
 import os
-from flask import Flask, request, jsonify, render_template
+import io
+import hashlib
+import queue
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import DefaultJSONProvider
+import tensorflow as tf
 from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing import image
 import numpy as np
+from PIL import Image
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
+from streaming_form_data import ParseFailedException, StreamingFormDataParser
+from streaming_form_data.targets import ValueTarget
 from flask_cors import CORS
-import json
+import orjson
+
+# OpenCV's SIMD decode/resize is used when available; otherwise Pillow (or the
+# pillow-simd drop-in) does the work.
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Numba fuses the uint8 -> float32 /255 pass for the normalized-input path
+try:
+    import numba
+except ImportError:
+    numba = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, used by jsonify and request.json.
+    Types orjson can't serialize natively fall back to Flask's default hook.
+    """
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app) # Enable CORS for all routes
 
 # Ensure the 'static/uploads' directory exists
 UPLOAD_FOLDER = 'static/uploads'
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+# Uploads are parsed into memory, so cap the request body; werkzeug enforces
+# this on request.stream and raises RequestEntityTooLarge past it
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
 
-# Load your pre-trained autism detection model
-try:
-    model = load_model('autism (1).h5')
-    print("AI model loaded successfully.")
-except Exception as e:
-    print(f"Error loading model: {e}")
-    model = None
+# Inference backend: 'keras' runs the .h5 model in-process, 'serving' sends
+# the uint8 image tensor to TensorFlow Serving over gRPC so concurrent
+# requests can be batched server-side (see batch.cfg), 'tflite' runs the
+# int8-quantized model from export_model.py on uint8 pixels, 'onnx' runs the
+# tf2onnx export under ONNX Runtime (CUDA when available).
+INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND', 'keras')
+MODEL_PATH = 'autism (1).h5'
+TFLITE_PATH = os.environ.get('TFLITE_PATH', 'autism.tflite')
+ONNX_PATH = os.environ.get('ONNX_PATH', 'autism.onnx')
+# Threads per inference call; gunicorn.conf.py sets this to 1 so many worker
+# processes don't oversubscribe the cores. Unset means use all cores.
+INTRA_OP_THREADS = int(os.environ.get('TF_INTRA_OP_THREADS', '0')) or None
+TF_SERVING_ADDR = os.environ.get('TF_SERVING_ADDR', 'localhost:8500')
+TF_SERVING_MODEL = os.environ.get('TF_SERVING_MODEL', 'autism')
+TF_SERVING_TIMEOUT = float(os.environ.get('TF_SERVING_TIMEOUT', '10.0'))
+
+model = None
+infer = None
+run_model = None
+_serving_stub = None
+_interpreter = None
+_interpreter_lock = threading.Lock()
+_onnx_session = None
+_onnx_input_name = None
+# Whether run_model takes raw uint8 pixels instead of float32 scaled to [0, 1].
+# Only the ONNX export still expects normalized floats.
+model_takes_uint8 = INFERENCE_BACKEND != 'onnx'
+
+def _build_infer(model):
+    """
+    Wraps the model in a traced graph call so single-image requests skip the
+    per-call overhead of model.predict (data adapter, callbacks, progress bar).
+    Takes uint8 pixels; the cast and /255 scaling run inside the graph.
+    """
+    @tf.function(input_signature=[tf.TensorSpec([None, 256, 256, 3], tf.uint8)])
+    def infer(x):
+        x = tf.cast(x, tf.float32) * (1.0 / 255.0)
+        return model(x, training=False)
+
+    # Trace once at startup so the first request doesn't pay for it
+    infer(np.zeros((1, 256, 256, 3), np.uint8))
+    return infer
+
+def _keras_predict(img_array):
+    return infer(tf.constant(img_array)).numpy()[:, 0]
+
+def _get_serving_stub():
+    """
+    Returns the gRPC stub, creating the channel on first use so each worker
+    process keeps (and reuses) its own HTTP/2 connection.
+    """
+    global _serving_stub
+    if _serving_stub is None:
+        import grpc
+        from tensorflow_serving.apis import prediction_service_pb2_grpc
+        channel = grpc.insecure_channel(TF_SERVING_ADDR)
+        _serving_stub = prediction_service_pb2_grpc.PredictionServiceStub(channel)
+    return _serving_stub
+
+def _serving_predict(img_array):
+    from tensorflow_serving.apis import predict_pb2
+    req = predict_pb2.PredictRequest()
+    req.model_spec.name = TF_SERVING_MODEL
+    req.model_spec.signature_name = 'serving_default'
+    req.inputs['image'].CopyFrom(tf.make_tensor_proto(img_array, dtype=tf.uint8))
+    resp = _get_serving_stub().Predict(req, timeout=TF_SERVING_TIMEOUT)
+    return np.asarray(resp.outputs['dense'].float_val, dtype=np.float32)
+
+def _load_tflite_interpreter(path):
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        Interpreter = tf.lite.Interpreter
+    # XNNPACK is applied by default to the supported (float and int8) ops
+    interpreter = Interpreter(model_path=path, num_threads=INTRA_OP_THREADS or os.cpu_count())
+    interpreter.allocate_tensors()
+    return interpreter
+
+def _tflite_predict(img_array):
+    """
+    Runs the quantized model on a uint8 pixel batch. The converter calibrates
+    the input on [0, 1] images, so pixels normally map 1:1 onto the quantized
+    input; otherwise they are requantized with the model's scale/zero point.
+    """
+    with _interpreter_lock:
+        input_details = _interpreter.get_input_details()[0]
+        output_details = _interpreter.get_output_details()[0]
+        if tuple(input_details['shape']) != img_array.shape:
+            _interpreter.resize_tensor_input(input_details['index'], img_array.shape)
+            _interpreter.allocate_tensors()
+
+        scale, zero_point = input_details['quantization']
+        if scale and not (abs(scale * 255.0 - 1.0) < 1e-3 and zero_point == 0):
+            img_array = np.clip(np.round(img_array / (255.0 * scale) + zero_point), 0, 255)
+        _interpreter.set_tensor(input_details['index'], img_array.astype(input_details['dtype'], copy=False))
+        _interpreter.invoke()
+        output = _interpreter.get_tensor(output_details['index'])
+
+    scale, zero_point = output_details['quantization']
+    if scale and output.dtype != np.float32:
+        output = (output.astype(np.float32) - zero_point) * scale
+    return output[:, 0]
+
+def _load_onnx_session(path):
+    import onnxruntime as ort
+    options = ort.SessionOptions()
+    if INTRA_OP_THREADS:
+        options.intra_op_num_threads = INTRA_OP_THREADS
+    providers = []
+    if 'CUDAExecutionProvider' in ort.get_available_providers():
+        providers.append(('CUDAExecutionProvider', {'cudnn_conv_algo_search': 'HEURISTIC'}))
+    providers.append('CPUExecutionProvider')
+    return ort.InferenceSession(path, sess_options=options, providers=providers)
+
+def _onnx_predict(img_array):
+    return _onnx_session.run(None, {_onnx_input_name: img_array})[0][:, 0]
+
+def load_inference_backend():
+    """
+    Loads the model for INFERENCE_BACKEND in the current process. Under
+    gunicorn this runs in each worker after the fork (see gunicorn.conf.py):
+    TensorFlow's thread pools and CUDA contexts don't survive a fork, so they
+    must not be created in the preloading master.
+    """
+    global model, infer, run_model, _interpreter, _onnx_session, _onnx_input_name
+
+    # Let TensorFlow grow GPU memory on demand instead of reserving all of it
+    for gpu in tf.config.list_physical_devices('GPU'):
+        tf.config.experimental.set_memory_growth(gpu, True)
+    if INTRA_OP_THREADS:
+        tf.config.threading.set_intra_op_parallelism_threads(INTRA_OP_THREADS)
+
+    # Load your pre-trained autism detection model
+    try:
+        if INFERENCE_BACKEND == 'serving':
+            run_model = _serving_predict
+            print(f"Using TensorFlow Serving model '{TF_SERVING_MODEL}' at {TF_SERVING_ADDR}.")
+        elif INFERENCE_BACKEND == 'tflite':
+            _interpreter = _load_tflite_interpreter(TFLITE_PATH)
+            run_model = _tflite_predict
+            print(f"Quantized TFLite model loaded from {TFLITE_PATH}.")
+        elif INFERENCE_BACKEND == 'onnx':
+            _onnx_session = _load_onnx_session(ONNX_PATH)
+            _onnx_input_name = _onnx_session.get_inputs()[0].name
+            run_model = _onnx_predict
+            print(f"ONNX model loaded from {ONNX_PATH} ({_onnx_session.get_providers()[0]}).")
+        else:
+            model = load_model(MODEL_PATH)
+            infer = _build_infer(model)
+            run_model = _keras_predict
+            print("AI model loaded successfully.")
+    except Exception as e:
+        print(f"Error loading model: {e}")
+        run_model = None
+
+# Concurrent /predict calls in this process are coalesced into one model call
+# of up to MAX_BATCH_SIZE images. The dispatcher never waits for a batch to
+# fill: it takes whatever requests queued up while the previous model call was
+# running, so a lone request runs immediately. TF Serving batches server-side,
+# so it is called directly.
+MAX_BATCH_SIZE = 32
+MICROBATCHING = INFERENCE_BACKEND != 'serving'
+_batch_queue = None
+_batch_thread_pid = None
+
+def _batch_worker(batch_queue):
+    while True:
+        batch = [batch_queue.get()]
+        while len(batch) < MAX_BATCH_SIZE:
+            try:
+                batch.append(batch_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            if len(batch) == 1:
+                # Already a batch of one; skip the copy np.concatenate would make
+                inputs = batch[0][0]
+            else:
+                inputs = np.concatenate([img_array for img_array, _ in batch])
+            scores = run_model(inputs)
+            if len(scores) != len(batch):
+                raise RuntimeError(f"Model returned {len(scores)} scores for a batch of {len(batch)} images")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            continue
+        for (_, future), score in zip(batch, scores):
+            future.set_result(float(score))
+
+def start_batcher():
+    """
+    Starts this process's dispatcher thread. Called from init_worker(), which
+    under gunicorn runs in each worker after the fork, since a thread started
+    in the preloading master would not survive into the workers.
+    """
+    global _batch_queue, _batch_thread_pid
+    if _batch_thread_pid == os.getpid():
+        return
+    _batch_queue = queue.Queue()
+    threading.Thread(target=_batch_worker, args=(_batch_queue,), name='inference-batcher', daemon=True).start()
+    _batch_thread_pid = os.getpid()
+
+def predict_score(img_array):
+    """
+    Returns the model score for a single preprocessed image (a batch of one).
+    Falls back to a direct model call if this process has no dispatcher.
+    """
+    if not MICROBATCHING or _batch_thread_pid != os.getpid():
+        return float(run_model(img_array)[0])
+    future = Future()
+    _batch_queue.put((img_array, future))
+    return future.result()
+
+# Recent predictions keyed by a hash of the uploaded image bytes, so repeated
+# uploads of the same file skip preprocessing and the forward pass.
+PREDICTION_CACHE_SIZE = 1024
+_prediction_cache = OrderedDict()
+_prediction_cache_lock = threading.Lock()
+
+def get_cached_prediction(key):
+    with _prediction_cache_lock:
+        result = _prediction_cache.get(key)
+        if result is not None:
+            _prediction_cache.move_to_end(key)
+        return result
+
+def cache_prediction(key, result):
+    with _prediction_cache_lock:
+        _prediction_cache[key] = result
+        _prediction_cache.move_to_end(key)
+        if len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+            _prediction_cache.popitem(last=False)
+
+def load_image(img_bytes):
+    """
+    Decodes encoded image bytes into a 256x256x3 RGB uint8 array.
+    """
+    if cv2 is not None:
+        # Ignore EXIF orientation to match the Pillow path
+        bgr = cv2.imdecode(np.frombuffer(img_bytes, np.uint8),
+                           cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+        if bgr is not None:
+            rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            return cv2.resize(rgb, (256, 256), interpolation=cv2.INTER_LINEAR)
+    with Image.open(io.BytesIO(img_bytes)) as img:
+        img = img.convert('RGB').resize((256, 256), Image.BILINEAR)
+        return np.asarray(img, dtype=np.uint8)
+
+# Reusable float32 input batches for the normalized-input path. A free list
+# rather than threading.local: under gevent many requests share one OS thread,
+# and a buffer must stay untouched until the batcher has consumed it. At most
+# MAX_BATCH_SIZE buffers are kept; extras from a burst are left to the GC.
+_free_input_buffers = queue.SimpleQueue()
+
+@contextmanager
+def input_buffer():
+    try:
+        buffer = _free_input_buffers.get_nowait()
+    except queue.Empty:
+        buffer = np.empty((1, 256, 256, 3), np.float32)
+    try:
+        yield buffer
+    finally:
+        if _free_input_buffers.qsize() < MAX_BATCH_SIZE:
+            _free_input_buffers.put(buffer)
+
+_normalize_into = None
+if numba is not None:
+    # Serial on purpose: for a 256x256x3 image, prange's thread dispatch costs
+    # more than it saves, and no thread pool means nothing to break on fork.
+    @numba.njit(fastmath=True, cache=True)
+    def _normalize_into(src, dst):
+        """
+        Writes src (H, W, 3) uint8 scaled to [0, 1] into dst[0] in one pass.
+        """
+        for y in range(src.shape[0]):
+            for x in range(src.shape[1]):
+                for c in range(src.shape[2]):
+                    dst[0, y, x, c] = src[y, x, c] * np.float32(1.0 / 255.0)
+
+    if not model_takes_uint8:
+        # Compile at startup instead of on the first request, for both the
+        # writable arrays OpenCV returns and the read-only np.asarray view of
+        # a Pillow image (Numba specializes on writability).
+        _dst_type = numba.types.Array(numba.types.float32, 4, 'C')
+        for _readonly in (False, True):
+            _src_type = numba.types.Array(numba.types.uint8, 3, 'C', readonly=_readonly)
+            _normalize_into.compile((_src_type, _dst_type))
+
+def preprocess_image(img_bytes, out=None):
+    """
+    Preprocesses the uploaded image bytes for model prediction, writing the
+    normalized (1, 256, 256, 3) batch into `out` when given.
+    """
+    if out is None:
+        out = np.empty((1, 256, 256, 3), np.float32)
+    img_array = load_image(img_bytes)
+    if _normalize_into is not None:
+        _normalize_into(np.ascontiguousarray(img_array), out)
+    else:
+        np.copyto(out[0], img_array)
+        np.multiply(out, np.float32(1 / 255.0), out=out)
+    return out
+
+UPLOAD_CHUNK_SIZE = 65536
+
+def save_upload(img_path, data):
+    """
+    Writes the upload to a temp file next to img_path and renames it into
+    place, so concurrent identical uploads never expose a half-written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(img_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, img_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+class FormFieldTarget(ValueTarget):
+    """
+    ValueTarget that also records whether the field was sent at all, so an
+    empty field can be told apart from a missing one.
+    """
+    received = False
+
+    def on_start(self):
+        self.received = True
+
+def parse_predict_form():
+    """
+    Parses the multipart /predict body straight from the request stream,
+    bypassing werkzeug's form parser. Returns the image target, the
+    individual biomedical fields (or None if none were sent), the legacy
+    biomedicalData JSON string (or None) and whether fast mode was requested.
+    Non-multipart bodies (urlencoded forms, which can't carry an image) go
+    through request.form.
+    """
+    if request.mimetype != 'multipart/form-data':
+        form = request.form
+        biomedical_fields = None
+        if any(key in form for key in BIOMEDICAL_KEYS):
+            biomedical_fields = {key: form.get(key, '') for key in BIOMEDICAL_KEYS}
+        fast_mode = form.get('fastMode', '').lower() in ('1', 'true', 'on')
+        return ValueTarget(), biomedical_fields, form.get('biomedicalData') or None, fast_mode
+
+    image_target = ValueTarget()
+    biomedical_targets = {key: FormFieldTarget() for key in BIOMEDICAL_KEYS}
+    biomedical_target = ValueTarget()
+    fast_mode_target = ValueTarget()
+    parser = StreamingFormDataParser(headers={'Content-Type': request.content_type})
+    parser.register('image', image_target)
+    for key, target in biomedical_targets.items():
+        parser.register(key, target)
+    parser.register('biomedicalData', biomedical_target)
+    parser.register('fastMode', fast_mode_target)
+    while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+        parser.data_received(chunk)
+
+    biomedical_fields = None
+    if any(target.received for target in biomedical_targets.values()):
+        biomedical_fields = {key: target.value.decode('utf-8') for key, target in biomedical_targets.items()}
+    biomedical_data_str = biomedical_target.value.decode('utf-8') or None
+    fast_mode = fast_mode_target.value.lower() in (b'1', b'true', b'on')
+    return image_target, biomedical_fields, biomedical_data_str, fast_mode
+
+# Biomedical fields used by the risk check, in the order they are stored
+BIOMEDICAL_KEYS = ('eeg', 'heartRate', 'cholesterol')
+# Risk is flagged when the EEG score is above and the heart rate below these
+BIOMEDICAL_THRESHOLDS = np.array([7.0, 70.0], np.float64)
+
+# In fast mode the image model is skipped when the biomedical data flags a risk
+# by at least these margins past both thresholds.
+FAST_MODE_MARGINS = np.array([1.5, 10.0], np.float64)
 
-def preprocess_image(img_path):
+def _to_float(value):
     """
-    Preprocesses the uploaded image for model prediction.
+    Converts a biomedical field to float; empty/missing fields count as 0.0.
     """
-    img = image.load_img(img_path, target_size=(256, 256))
-    img_array = image.img_to_array(img)
-    img_array = np.expand_dims(img_array, axis=0)
-    img_array /= 255.0
-    return img_array
+    if value is None or value == '':
+        return 0.0
+    try:
+        return float(value)
+    except TypeError:
+        raise ValueError(f"could not convert {type(value).__name__} to float: {value!r}")
+
+def parse_biomedical_values(params):
+    """
+    Returns the BIOMEDICAL_KEYS fields of the parsed payload as a float64 array
+    (float32 would round values like 69.999999 onto the thresholds).
+    """
+    return np.fromiter((_to_float(params.get(key, '')) for key in BIOMEDICAL_KEYS),
+                       dtype=np.float64, count=len(BIOMEDICAL_KEYS))
+
+def biomedical_risk(values):
+    return bool(values[0] > BIOMEDICAL_THRESHOLDS[0]) and bool(values[1] < BIOMEDICAL_THRESHOLDS[1])
+
+def biomedical_confidence_high(values):
+    """
+    Returns True when the biomedical inputs are far inside the risk region,
+    i.e. clear of both decision thresholds by the fast-mode margins.
+    """
+    eeg_score, heart_rate = values[0], values[1]
+    return (bool(eeg_score > BIOMEDICAL_THRESHOLDS[0] + FAST_MODE_MARGINS[0])
+            and bool(0.0 < heart_rate < BIOMEDICAL_THRESHOLDS[1] - FAST_MODE_MARGINS[1]))
+
+def init_worker():
+    """
+    Per-process setup: loads the model and starts the batch dispatcher. Under
+    gunicorn this runs in each worker from post_worker_init, after the fork;
+    under the dev server it runs from __main__, otherwise at import.
+    """
+    if INFERENCE_BACKEND == 'serving':
+        try:
+            from gevent import monkey
+            gevent_patched = monkey.is_module_patched('socket')
+        except ImportError:
+            gevent_patched = False
+        if gevent_patched:
+            # Lets Predict calls yield to other greenlets instead of blocking
+            # the worker; must run before the first channel is created.
+            import grpc.experimental.gevent
+            grpc.experimental.gevent.init_gevent()
+    load_inference_backend()
+    if MICROBATCHING:
+        start_batcher()
+
+# gunicorn.conf.py sets DEFER_MODEL_LOAD so the preloading master only imports
+# the app; each worker then calls init_worker() after forking. Run as a script,
+# __main__ below decides whether to load the model at all.
+if __name__ != '__main__' and os.environ.get('DEFER_MODEL_LOAD') != '1':
+    init_worker()
 
 @app.route('/', methods=['GET'])
 def index_page():
@@ -47,54 +507,41 @@ def predict():
     Handles image and biomedical data for autism prediction.
     Ensures all error responses are JSON.
     """
-    if not model:
+    if not run_model:
         print("Error: Model not loaded when /predict was called.")
         return jsonify({'error': 'AI model not loaded on server.'}), 500
 
     image_result = None
     biomedical_result = None
     img_path = None
+    skip_image_model = False
 
     try:
-        # Process image if uploaded
-        if 'image' in request.files and request.files['image'].filename != '':
-            img_file = request.files['image']
-            filename = secure_filename(img_file.filename)
-            img_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            img_file.save(img_path)
-            
-            img_array = preprocess_image(img_path)
-            prediction = model.predict(img_array)[0][0]
-
-            if prediction > 0.5:
-                image_result = 'Non Autistic'
-            else:
-                image_result = 'Autistic'
-            print(f"Image prediction: {image_result} (Score: {prediction})")
+        try:
+            image_target, biomedical_fields, biomedical_data_str, fast_mode = parse_predict_form()
+        except (ParseFailedException, UnicodeDecodeError) as e:
+            print(f"Malformed form data in /predict: {e}")
+            return jsonify({'error': 'Malformed form data. Please check your inputs.'}), 400
 
-        # Process biomedical data if provided
-        biomedical_data_str = request.form.get('biomedicalData')
-        if biomedical_data_str:
+        # Process biomedical data if provided, as eeg/heartRate/cholesterol form
+        # fields or, for older API clients, as a biomedicalData JSON string
+        if biomedical_fields is not None or biomedical_data_str:
             try:
-                biomedical_params = json.loads(biomedical_data_str)
+                if biomedical_fields is not None:
+                    biomedical_params = biomedical_fields
+                else:
+                    biomedical_params = orjson.loads(biomedical_data_str)
                 print(f"Received biomedical data: {biomedical_params}")
-                
-                eeg_str = biomedical_params.get('eeg', '')
-                eeg_score = float(eeg_str) if eeg_str != '' else 0.0
-
-                heart_rate_str = biomedical_params.get('heartRate', '')
-                heart_rate = float(heart_rate_str) if heart_rate_str != '' else 0.0
 
-                cholesterol_str = biomedical_params.get('cholesterol', '')
-                cholesterol = float(cholesterol_str) if cholesterol_str != '' else 0.0
-                
-                if eeg_score > 7.0 and heart_rate < 70.0:
+                biomedical_values = parse_biomedical_values(biomedical_params)
+                if biomedical_risk(biomedical_values):
                     biomedical_result = 'Potential Autism Risk (based on biomedical data)'
+                    skip_image_model = fast_mode and biomedical_confidence_high(biomedical_values)
                 else:
                     biomedical_result = 'Low Autism Risk (based on biomedical data)'
                 print(f"Biomedical prediction: {biomedical_result}")
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 print(f"JSONDecodeError: Invalid JSON format for biomedical data: {biomedical_data_str}")
                 return jsonify({'error': 'Invalid JSON format for biomedical data. Please check your inputs.'}), 400
             except ValueError as ve:
@@ -104,6 +551,41 @@ def predict():
                 print(f"Error processing biomedical data: {e}")
                 return jsonify({'error': f"Error processing biomedical data: {e}"}), 400
 
+        # Process image if uploaded. It is decoded from memory; a copy is only
+        # written to the uploads folder when the client asks for it (?save=1).
+        if image_target.multipart_filename:
+            buf = image_target.value
+            image_hash = hashlib.blake2b(buf, digest_size=16)
+            if request.args.get('save') == '1':
+                # Content-addressed name: identical uploads share one file and
+                # concurrent uploads with the same client filename can't collide
+                ext = os.path.splitext(secure_filename(image_target.multipart_filename))[1].lower() or '.jpg'
+                filename = image_hash.hexdigest() + ext
+                img_path = os.path.join(UPLOAD_FOLDER, filename)
+                if not os.path.exists(img_path):
+                    save_upload(img_path, buf)
+
+            if skip_image_model:
+                print("Fast mode: biomedical data is decisive, skipping image model.")
+            else:
+                cache_key = image_hash.digest()
+                cached = get_cached_prediction(cache_key)
+                if cached is not None:
+                    prediction, image_result = cached
+                else:
+                    if model_takes_uint8:
+                        prediction = predict_score(load_image(buf)[None, ...])
+                    else:
+                        with input_buffer() as img_array:
+                            prediction = predict_score(preprocess_image(buf, out=img_array))
+
+                    if prediction > 0.5:
+                        image_result = 'Non Autistic'
+                    else:
+                        image_result = 'Autistic'
+                    cache_prediction(cache_key, (prediction, image_result))
+                print(f"Image prediction: {image_result} (Score: {prediction})")
+
         # Combine predictions (placeholder logic)
         final_prediction = "Unable to determine"
         if image_result and biomedical_result:
@@ -129,42 +611,74 @@ def predict():
             'image_path': '/' + img_path if img_path else None
         })
 
+    except RequestEntityTooLarge:
+        max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+        return jsonify({'error': f'Upload too large. The maximum request size is {max_mb} MB.'}), 413
     except Exception as e:
         print(f"An unexpected error occurred during prediction: {e}")
         return jsonify({'error': f'An unexpected server error occurred: {e}'}), 500
 
+# Both endpoints below serve static content, so the JSON body is built once
+# at import time instead of on every request.
+HEALTHY_TIPS = [
+    "**Early Intervention:** Early diagnosis and intervention can significantly improve outcomes. Therapies like Applied Behavior Analysis (ABA), speech therapy, and occupational therapy can be very beneficial.",
+    "**Structured Environment:** Creating a predictable and structured environment can help individuals with autism feel secure and reduce anxiety. Visual schedules and clear routines are often helpful.",
+    "**Communication Strategies:** Explore various communication methods, including verbal communication, picture exchange systems (PECS), or augmentative and alternative communication (AAC) devices, to find what works best.",
+    "**Sensory Regulation:** Many individuals with autism have sensory sensitivities. Identifying and addressing these sensitivities through sensory diets, calming spaces, or sensory-friendly activities can improve comfort and focus.",
+    "**Diet and Nutrition:** While there's no specific 'autism diet,' some families find that dietary interventions (e.g., gluten-free, casein-free diets) can help with certain symptoms. Consult with a healthcare professional before making significant dietary changes.",
+    "**Physical Activity:** Regular physical activity can help with motor skills, sensory integration, and overall well-being. Activities like swimming, yoga, or martial arts can be particularly beneficial.",
+    "**Support Networks:** Connect with other families, support groups, and organizations dedicated to autism. Sharing experiences and resources can be invaluable.",
+    "**Individualized Education Programs (IEPs):** For children, an individualized education program (IEP) tailored to their specific needs can provide necessary academic and developmental support in school.",
+    "**Self-Care for Caregivers:** Caring for an individual with autism can be demanding. Prioritizing self-care, seeking respite, and maintaining personal well-being are crucial for caregivers."
+]
+
+CREATOR_DETAILS = {
+    "Project Name": "Autism Spectrum Disorder Detector",
+    "Creators": [
+        {"Name": "Dheeraj Wan", "Role": "Group Leader", "Image": "https://placehold.co/100x100?text=Dheeraj"},
+        {"Name": "Sonil Talreja", "Role": "Team Member", "Image": "https://placehold.co/100x100?text=Sonil"},
+        {"Name": "Sahil Chhabria", "Role": "Team Member", "Image": "https://placehold.co/100x100?text=Sahil"}
+    ],
+    "Contact": "asdetectectco@gmail.com", # Replace with actual contact info if available
+    "Version": "1.0.0",
+    "Date": "July 2025"
+}
+
+_HEALTHY_TIPS_BYTES = orjson.dumps({'tips': HEALTHY_TIPS})
+_HEALTHY_TIPS_ETAG = hashlib.sha256(_HEALTHY_TIPS_BYTES).hexdigest()
+_CREATOR_DETAILS_BYTES = orjson.dumps({'details': CREATOR_DETAILS})
+_CREATOR_DETAILS_ETAG = hashlib.sha256(_CREATOR_DETAILS_BYTES).hexdigest()
+STATIC_JSON_MAX_AGE = 3600
+
+def static_json_response(body, etag):
+    """
+    Returns a cacheable JSON response, or an empty 304 Not Modified when the
+    client's If-None-Match shows it already has this body. The ETag is a hash
+    of the body, so it is the same in every worker and across restarts.
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_JSON_MAX_AGE}'
+    return response.make_conditional(request)
+
 @app.route('/healthy-tips', methods=['GET'])
 def healthy_tips():
-    tips = [
-        "**Early Intervention:** Early diagnosis and intervention can significantly improve outcomes. Therapies like Applied Behavior Analysis (ABA), speech therapy, and occupational therapy can be very beneficial.",
-        "**Structured Environment:** Creating a predictable and structured environment can help individuals with autism feel secure and reduce anxiety. Visual schedules and clear routines are often helpful.",
-        "**Communication Strategies:** Explore various communication methods, including verbal communication, picture exchange systems (PECS), or augmentative and alternative communication (AAC) devices, to find what works best.",
-        "**Sensory Regulation:** Many individuals with autism have sensory sensitivities. Identifying and addressing these sensitivities through sensory diets, calming spaces, or sensory-friendly activities can improve comfort and focus.",
-        "**Diet and Nutrition:** While there's no specific 'autism diet,' some families find that dietary interventions (e.g., gluten-free, casein-free diets) can help with certain symptoms. Consult with a healthcare professional before making significant dietary changes.",
-        "**Physical Activity:** Regular physical activity can help with motor skills, sensory integration, and overall well-being. Activities like swimming, yoga, or martial arts can be particularly beneficial.",
-        "**Support Networks:** Connect with other families, support groups, and organizations dedicated to autism. Sharing experiences and resources can be invaluable.",
-        "**Individualized Education Programs (IEPs):** For children, an individualized education program (IEP) tailored to their specific needs can provide necessary academic and developmental support in school.",
-        "**Self-Care for Caregivers:** Caring for an individual with autism can be demanding. Prioritizing self-care, seeking respite, and maintaining personal well-being are crucial for caregivers."
-    ]
-    return jsonify({'tips': tips})
+    return static_json_response(_HEALTHY_TIPS_BYTES, _HEALTHY_TIPS_ETAG)
 
 @app.route('/creator-details', methods=['GET'])
 def creator_details():
     """
     Provides project creator details.
     """
-    details = {
-        "Project Name": "Autism Spectrum Disorder Detector",
-        "Creators": [
-            {"Name": "Dheeraj Wan", "Role": "Group Leader", "Image": "https://placehold.co/100x100?text=Dheeraj"},
-            {"Name": "Sonil Talreja", "Role": "Team Member", "Image": "https://placehold.co/100x100?text=Sonil"},
-            {"Name": "Sahil Chhabria", "Role": "Team Member", "Image": "https://placehold.co/100x100?text=Sahil"}
-        ],
-        "Contact": "asdetectectco@gmail.com", # Replace with actual contact info if available
-        "Version": "1.0.0",
-        "Date": "July 2025"
-    }
-    return jsonify({'details': details})
+    return static_json_response(_CREATOR_DETAILS_BYTES, _CREATOR_DETAILS_ETAG)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # The Werkzeug dev server is for local development only; production runs
+    # under gunicorn (see gunicorn.conf.py). The reloader stays off because it
+    # imports the app (and loads the model) a second time.
+    if os.environ.get('FLASK_ENV') == 'development':
+        init_worker()
+        app.run(use_reloader=False)
+    else:
+        print("Start the server with 'gunicorn -c gunicorn.conf.py app:app', "
+              "or set FLASK_ENV=development to use the dev server.")
\ No newline at end of file
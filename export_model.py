@@ -0,0 +1,73 @@
+"""
+Exports the trained Keras model for serving.
+
+Usage:
+    python export_model.py savedmodel [export_dir]
+    python export_model.py tflite <calibration_image_dir> [output_path]
+"""
+import os
+import sys
+import numpy as np
+import tensorflow as tf
+from PIL import Image
+from tensorflow.keras.models import load_model
+
+MODEL_PATH = 'autism (1).h5'
+CALIBRATION_SAMPLES = 200
+
+def export_savedmodel(export_dir):
+    """
+    Saves the model as a versioned SavedModel whose 'serving_default'
+    signature takes a uint8 'image' batch and returns the 'dense' score.
+    Resizing to 256x256 and the /255 scaling happen inside the graph, so
+    clients send 4x smaller uint8 tensors instead of normalized floats.
+    """
+    model = load_model(MODEL_PATH)
+
+    @tf.function(input_signature=[tf.TensorSpec([None, None, None, 3], tf.uint8, name='image')])
+    def serving_fn(image):
+        x = tf.image.resize(tf.cast(image, tf.float32), [256, 256]) * (1.0 / 255.0)
+        return {'dense': model(x, training=False)}
+
+    tf.saved_model.save(model, export_dir, signatures={'serving_default': serving_fn})
+    print(f"SavedModel written to {export_dir}")
+
+def export_tflite(calibration_dir, output_path):
+    """
+    Converts the model to TFLite with full-integer post-training quantization.
+    Calibration images are scaled to [0, 1] like the training data, and the
+    input is exposed as uint8 so raw pixels can be fed without a float pass.
+    """
+    model = load_model(MODEL_PATH)
+    paths = sorted(
+        os.path.join(calibration_dir, name) for name in os.listdir(calibration_dir)
+        if name.lower().endswith(('.jpg', '.jpeg', '.png'))
+    )[:CALIBRATION_SAMPLES]
+    if not paths:
+        raise SystemExit(f"No calibration images found in {calibration_dir}")
+
+    def representative_dataset():
+        for path in paths:
+            with Image.open(path) as img:
+                img = img.convert('RGB').resize((256, 256), Image.BILINEAR)
+                img_array = np.asarray(img, dtype=np.float32) / 255.0
+            yield [img_array[None, ...]]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    with open(output_path, 'wb') as f:
+        f.write(converter.convert())
+    print(f"Quantized TFLite model written to {output_path}")
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in ('savedmodel', 'tflite'):
+        raise SystemExit(__doc__)
+    if sys.argv[1] == 'savedmodel':
+        export_savedmodel(sys.argv[2] if len(sys.argv) > 2 else 'models/autism/1')
+    else:
+        if len(sys.argv) < 3:
+            raise SystemExit(__doc__)
+        export_tflite(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else 'autism.tflite')
@@ -0,0 +1,48 @@
+"""
+Gunicorn settings for serving app.py.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+"""
+import os
+
+# gevent must patch the standard library before app.py is imported, because
+# with preload_app the master imports it, and the locks it creates there
+# (the interpreter and prediction-cache locks) are inherited by the workers.
+# Unpatched, they are real OS locks that block a worker's only thread.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+if worker_class == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
+import multiprocessing
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Import the app once in the master so workers fork with Flask, TensorFlow and
+# the rest already imported. The model itself is loaded in each worker by
+# post_worker_init below: TensorFlow's thread pools and CUDA contexts don't
+# survive a fork, so the master must not start them.
+preload_app = True
+os.environ['DEFER_MODEL_LOAD'] = '1'
+
+# Every worker holds its own copy of the model, so memory grows with the worker
+# count; with gevent handling concurrency, one worker per core is enough.
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+# gevent keeps many keep-alive connections open per worker. Model inference
+# is CPU-bound and blocks the worker's event loop while it runs, so every
+# connection on that worker (static endpoints included) waits for it; the
+# batcher in app.py coalesces /predict calls queued up in the meantime.
+worker_connections = 1000
+keepalive = 5
+
+# One inference thread per worker process, otherwise every worker's thread
+# pool tries to use all cores. Read by app.py at import time.
+os.environ.setdefault('TF_INTRA_OP_THREADS', '1')
+
+# Inference on large uploads can exceed gunicorn's 30s default
+timeout = 120
+
+def post_worker_init(worker):
+    import app
+    app.init_worker()
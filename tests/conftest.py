@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Import app.py without loading a model; the tests stub run_model instead
+os.environ['DEFER_MODEL_LOAD'] = '1'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
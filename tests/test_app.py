@@ -0,0 +1,201 @@
+import io
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+import numpy as np
+import pytest
+
+import app as app_module
+
+POTENTIAL_RISK = 'Potential Autism Risk (based on biomedical data)'
+LOW_RISK = 'Low Autism Risk (based on biomedical data)'
+
+
+def png_bytes(color=(255, 0, 0)):
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.new('RGB', (32, 32), color).save(buf, 'PNG')
+    return buf.getvalue()
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    calls = []
+
+    def fake_run_model(batch):
+        calls.append(len(batch))
+        return np.full(len(batch), 0.9, np.float32)
+
+    monkeypatch.setattr(app_module, 'run_model', fake_run_model)
+    app_module._prediction_cache.clear()
+    return calls
+
+
+@pytest.fixture
+def client(model_calls):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def batcher():
+    if not app_module.MICROBATCHING:
+        pytest.skip('micro-batching is disabled for this backend')
+    app_module.start_batcher()
+
+
+def post_multipart(client, data, query=''):
+    return client.post('/predict' + query, data=data, content_type='multipart/form-data')
+
+
+def test_biomedical_form_fields(client):
+    resp = post_multipart(client, {'eeg': '9', 'heartRate': '55', 'cholesterol': ''})
+    assert resp.status_code == 200
+    assert resp.json['biomedical_prediction'] == POTENTIAL_RISK
+    assert resp.json['image_prediction'] is None
+
+
+def test_biomedical_json_fallback(client):
+    resp = post_multipart(client, {'biomedicalData': '{"eeg": "8", "heartRate": "65"}'})
+    assert resp.json['biomedical_prediction'] == POTENTIAL_RISK
+
+
+def test_empty_biomedical_fields_still_count_as_sent(client):
+    resp = post_multipart(client, {'eeg': '', 'heartRate': '', 'cholesterol': ''})
+    assert resp.json['biomedical_prediction'] == LOW_RISK
+
+
+def test_no_biomedical_fields(client):
+    resp = post_multipart(client, {'fastMode': '0'})
+    assert resp.json['biomedical_prediction'] is None
+    assert resp.json['combined_prediction'] == 'No data provided for prediction.'
+
+
+def test_image_prediction_is_cached(client, model_calls):
+    image = png_bytes()
+    for _ in range(2):
+        resp = post_multipart(client, {'image': (io.BytesIO(image), 'face.png')})
+        assert resp.json['image_prediction'] == 'Non Autistic'
+        assert resp.json['image_path'] is None
+    assert model_calls == [1]
+
+
+def test_prediction_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(app_module, 'PREDICTION_CACHE_SIZE', 2)
+    app_module._prediction_cache.clear()
+    app_module.cache_prediction(b'a', (0.1, 'Autistic'))
+    app_module.cache_prediction(b'b', (0.9, 'Non Autistic'))
+    assert app_module.get_cached_prediction(b'a') is not None
+    app_module.cache_prediction(b'c', (0.9, 'Non Autistic'))
+
+    assert app_module.get_cached_prediction(b'b') is None
+    assert app_module.get_cached_prediction(b'a') == (0.1, 'Autistic')
+    assert app_module.get_cached_prediction(b'c') == (0.9, 'Non Autistic')
+
+
+def test_biomedical_json_fallback_urlencoded(client):
+    resp = client.post('/predict', data={'biomedicalData': '{"eeg": "3", "heartRate": "80"}'})
+    assert resp.status_code == 200
+    assert resp.json['biomedical_prediction'] == LOW_RISK
+
+
+def test_upload_too_large(client, monkeypatch):
+    monkeypatch.setitem(app_module.app.config, 'MAX_CONTENT_LENGTH', 1024)
+    resp = post_multipart(client, {'image': (io.BytesIO(b'x' * 4096), 'face.png')})
+    assert resp.status_code == 413
+
+
+@pytest.mark.parametrize('body, content_type', [
+    (b'eeg=9', 'multipart/form-data'),
+    (b'--b\r\nContent-Disposition: form-data; name="eeg"\r\n\r\n\xff\r\n--b--\r\n',
+     'multipart/form-data; boundary=b'),
+])
+def test_malformed_form_data(client, body, content_type):
+    resp = client.post('/predict', data=body, content_type=content_type)
+    assert resp.status_code == 400
+    assert 'error' in resp.json
+
+
+def test_fast_mode_skips_image_model(client, model_calls):
+    resp = post_multipart(client, {
+        'image': (io.BytesIO(png_bytes()), 'face.png'),
+        'eeg': '9', 'heartRate': '55', 'fastMode': '1',
+    })
+    assert resp.json['image_prediction'] is None
+    assert resp.json['biomedical_prediction'] == POTENTIAL_RISK
+    assert model_calls == []
+
+
+def test_invalid_biomedical_number(client):
+    resp = post_multipart(client, {'eeg': 'high'})
+    assert resp.status_code == 400
+
+
+def test_thresholds_compare_in_float64(client):
+    resp = post_multipart(client, {'eeg': '7.0000001', 'heartRate': '69.999999'})
+    assert resp.json['biomedical_prediction'] == POTENTIAL_RISK
+
+
+def test_batch_errors_reach_every_waiting_request(monkeypatch, batcher):
+    def failing_run_model(batch):
+        raise RuntimeError('model failed')
+
+    monkeypatch.setattr(app_module, 'run_model', failing_run_model)
+    img_array = np.zeros((1, 256, 256, 3), np.uint8)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(app_module.predict_score, img_array) for _ in range(4)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match='model failed'):
+                future.result(timeout=10)
+
+
+def test_batch_with_missing_scores_fails_instead_of_hanging(monkeypatch, batcher):
+    monkeypatch.setattr(app_module, 'run_model', lambda batch: np.zeros(0, np.float32))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(app_module.predict_score, np.zeros((1, 256, 256, 3), np.uint8))
+        with pytest.raises(RuntimeError, match='scores'):
+            future.result(timeout=10)
+
+
+def test_input_buffer_free_list_is_capped():
+    while True:
+        try:
+            app_module._free_input_buffers.get_nowait()
+        except queue.Empty:
+            break
+    with ExitStack() as stack:
+        for _ in range(app_module.MAX_BATCH_SIZE + 5):
+            stack.enter_context(app_module.input_buffer())
+    assert app_module._free_input_buffers.qsize() == app_module.MAX_BATCH_SIZE
+
+
+@pytest.mark.parametrize('path', ['/healthy-tips', '/creator-details'])
+def test_static_json_not_modified(client, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'public, max-age=3600'
+    etag = first.headers['ETag']
+
+    cached = client.get(path, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+    stale = client.get(path, headers={'If-None-Match': '"something-else"'})
+    assert stale.status_code == 200
+
+
+@pytest.mark.parametrize('use_numba', [True, False])
+@pytest.mark.parametrize('writable', [True, False])
+def test_preprocess_image_matches_reference(monkeypatch, use_numba, writable):
+    if use_numba and app_module._normalize_into is None:
+        pytest.skip('numba is not installed')
+    if not use_numba:
+        monkeypatch.setattr(app_module, '_normalize_into', None)
+    # OpenCV returns writable arrays, Pillow's np.asarray a read-only view
+    img_array = np.random.default_rng(0).integers(0, 256, (256, 256, 3), np.uint8)
+    img_array.setflags(write=writable)
+    monkeypatch.setattr(app_module, 'load_image', lambda img_bytes: img_array)
+
+    out = app_module.preprocess_image(b'')
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, img_array[None] / 255, rtol=1e-6, atol=1e-7)